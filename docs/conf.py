@@ -12,6 +12,8 @@ import inspect
 import os
 import sys
 from typing import List
+from typing import Set
+from typing import Type
 
 from note_splitter import tokens
 
@@ -98,32 +100,42 @@ def create_token_hierarchy() -> str:
         "multiple others, so they are listed twice.\n",
     ]
 
-    all_token_types = tokens.get_all_token_types(tokens)
+    all_token_types = tokens.get_all_token_types()
     class_tree = inspect.getclasstree(all_token_types)
-    __create_token_subhierarchy(token_hierarchy, class_tree)
+    abstract_types = {t for t in all_token_types if inspect.isabstract(t)}
+    __create_token_subhierarchy(token_hierarchy, class_tree, abstract_types)
     token_hierarchy.append("")
     return "\n".join(token_hierarchy)
 
 
 def __create_token_subhierarchy(
-    token_hierarchy: List[str], class_tree: list, indentation: str = ""
+    token_hierarchy: List[str], class_tree: list, abstract_types: Set[Type]
 ) -> None:
-    """Creates part of the token hierarchy.
+    """Creates the lines of the token hierarchy.
 
-    The result is returned by reference.
+    The result is returned by reference. The class tree is walked
+    depth-first with a stack of iterators, one for each level of
+    nesting. Classes that inherit from more than one token type appear
+    in the tree more than once, so which types are abstract is
+    determined once beforehand.
     """
-    for c in class_tree:
-        if isinstance(c, list):
-            __create_token_subhierarchy(token_hierarchy, c, indentation + "    ")
-        else:
+    stack = [iter(class_tree)]
+    while stack:
+        for c in stack[-1]:
+            if isinstance(c, list):
+                stack.append(iter(c))
+                break
             class_name = c[0].__name__
             if class_name not in ("object", "ABC", "module"):
-                abstract = " (abstract)" if inspect.isabstract(c[0]) else ""
+                indentation = "    " * max(len(stack) - 2, 0)
+                abstract = " (abstract)" if c[0] in abstract_types else ""
                 line = (
-                    f"{indentation[4:]}* "
+                    f"{indentation}* "
                     f":py:class:`note_splitter.tokens.{class_name}`{abstract}"
                 )
                 token_hierarchy.append(line)
+        else:
+            stack.pop()
 
 
 save_token_hierarchy()
@@ -310,7 +310,9 @@ def create_pattern_input_field(name: str, value: str) -> sg.Element:
     ]
 
 
-def create_hyperlink(text: str, url: str, font: Tuple[str, int, str] = None) -> sg.Text:
+def create_hyperlink(
+    text: str, url: str, font: Optional[Tuple[str, int, str]] = None
+) -> sg.Text:
     """Creates a PySimpleGUI Text object with a clickable hyperlink.
 
     When the user clicks the hyperlink, the event created will start
@@ -322,7 +324,7 @@ def create_hyperlink(text: str, url: str, font: Tuple[str, int, str] = None) ->
         The text to display in the Text object.
     url : str
         The URL to open when the hyperlink is clicked.
-    font : Tuple[str, int, str]
+    font : Tuple[str, int, str], optional
         The font to use for the Text object. The first element is the
         font family, the second is the font size, and the third is the
         font style. The default is ('Arial', 14, 'underline').
@@ -384,11 +386,7 @@ def create_split_attr_dropdown() -> sg.Combo:
     if inspect.isabstract(settings["split_type"]):
         attr_names: List[Union[str, None]] = [None]
     else:
-        obj = settings["split_type"]()
-        attr_names = sorted(list(obj.__dict__.keys()))
-        attr_names.insert(0, None)
-        if issubclass(settings["split_type"], tokens.Block):
-            attr_names.remove("content")
+        attr_names = [None, *tokens.get_attr_names(settings["split_type"])]
     return sg.Combo(
         values=attr_names,
         default_value="level" if "level" in attr_names else None,
@@ -413,10 +411,7 @@ def update_split_attrs(values: dict, window: sg.Window) -> None:
         default_attr = None
         settings["split_attr"] = {}
     else:
-        attr_names = sorted(list(settings["split_type"]().__dict__.keys()))
-        attr_names.insert(0, None)
-        if issubclass(settings["split_type"], tokens.Block):
-            attr_names.remove("content")
+        attr_names = [None, *tokens.get_attr_names(settings["split_type"])]
         if "level" in attr_names:
             default_attr = "level"
         else:
@@ -7,7 +7,13 @@ types such as header. Then the lexer makes a quick pass over the token
 list while looking at each token's context to ensure they have the
 correct type.
 """
+import re
+from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Type
 
 from note_splitter import patterns
@@ -15,6 +21,9 @@ from note_splitter import settings
 from note_splitter import tokens
 
 
+_DEFAULT_FLAGS = re.compile("").flags
+
+
 class Lexer:
     """Creates a Callable that converts raw text to a list of tokens."""
 
@@ -27,41 +36,107 @@ class Lexer:
             The raw text to convert to a list of tokens.
         """
         self.__tokens: List[tokens.Token] = []
-        all_token_types = tokens.get_all_token_types(tokens)
+        typed_patterns = self.__get_typed_patterns()
+        combined_pattern = self.__combine_patterns(typed_patterns)
+        # The bound match methods are looked up once here rather than
+        # once per line.
+        match_combined: Optional[Callable[[str], Any]] = (
+            None if combined_pattern is None else combined_pattern.match
+        )
+        matchers = tuple((type_, pattern.match) for type_, pattern in typed_patterns)
+        types_by_name: Dict[str, Type] = {
+            type_.__name__: type_ for type_, _ in typed_patterns
+        }
+        # Notes often repeat lines, such as empty lines and table
+        # dividers, so each distinct line is only matched once, and
+        # the tokens of repeated lines share one string.
+        line_types: Dict[str, Tuple[Type, str]] = {}
         for line in text.split("\n"):
-            self.__tokens.append(self.__create_token(line, all_token_types))
+            line_type = line_types.get(line)
+            if line_type is None:
+                type_ = self.__get_token_type(
+                    line, match_combined, matchers, types_by_name
+                )
+                line_type = (type_, line)
+                line_types[line] = line_type
+            type_, line = line_type
+            self.__tokens.append(type_(line))
         self.__check_token_types()
         return self.__tokens
 
-    def __create_token(self, line: str, all_token_types: List[Type]) -> tokens.Token:
-        """Lexes the text, creates a token, and returns it.
+    def __get_token_type(
+        self,
+        line: str,
+        match_combined: Optional[Callable[[str], Any]],
+        matchers: Tuple[Tuple[Type, Callable[[str], Any]], ...],
+        types_by_name: Dict[str, Type],
+    ) -> Type:
+        """Determines which token type a line of text is.
 
         Parameters
         ----------
         line : str
-            The line of text to parse.
-        all_token_types : List[Type]
-            A list of all token types.
+            The line of text to categorize.
+        match_combined : Optional[Callable[[str], Any]]
+            The match method of all the token types' patterns combined,
+            or None if they could not be combined.
+        matchers : Tuple[Tuple[Type, Callable[[str], Any]], ...]
+            Each token type that has a pattern, paired with its
+            pattern's match method, in the order they should be tried.
+            These are only used if match_combined is None.
+        types_by_name : Dict[str, Type]
+            The token types by class name, which is also the name of
+            each type's group in the combined pattern.
         """
-        for type_ in all_token_types:
-            if type_.HAS_PATTERN and self.__matches(line, type_):
-                return type_(line)
-        return tokens.Text(line)
+        if match_combined is not None:
+            match = match_combined(line)
+            if match:
+                return types_by_name[match.lastgroup]
+            return tokens.Text
+        for type_, match_line in matchers:
+            if match_line(line):
+                return type_
+        return tokens.Text
 
-    def __matches(self, line: str, type_: Type[tokens.Token]) -> bool:
-        """Determines if the line matches the given type's pattern.
+    def __get_typed_patterns(self) -> List[Tuple[Type, re.Pattern]]:
+        """Gets each token type that has a pattern, paired with its pattern.
+
+        The patterns are looked up each time because the user may
+        change them while the program is running.
+        """
+        typed_patterns = []
+        for type_ in tokens.get_all_token_types():
+            if type_.HAS_PATTERN:
+                type_name = settings.get_token_type_name(type_).replace(" ", "_")
+                typed_patterns.append((type_, patterns.__dict__[type_name]))
+        return typed_patterns
+
+    def __combine_patterns(
+        self, typed_patterns: List[Tuple[Type, re.Pattern]]
+    ) -> Optional[re.Pattern]:
+        """Combines the token types' patterns into one pattern.
+
+        Each pattern becomes an alternative in a named group, so one
+        call to the combined pattern's ``match`` method finds the same
+        token type as trying each pattern in order. If any pattern has
+        its own groups or flags, combining could change what it
+        matches, so None is returned instead.
 
         Parameters
         ----------
-        line : str
-            The line of text to check.
-        type_ : Type[tokens.Token]
-            The token type to check the pattern of.
+        typed_patterns : List[Tuple[Type, re.Pattern]]
+            The token types paired with their patterns, in the order
+            they should be tried.
         """
-        type_name = settings.get_token_type_name(type_).replace(" ", "_")
-        if patterns.__dict__[type_name].match(line):
-            return True
-        return False
+        alternatives = []
+        for type_, pattern in typed_patterns:
+            if pattern.groups or pattern.flags != _DEFAULT_FLAGS:
+                return None
+            alternatives.append(f"(?P<{type_.__name__}>{pattern.pattern})")
+        try:
+            return re.compile("|".join(alternatives))
+        except re.error:
+            return None
 
     def __check_token_types(self) -> None:
         """Changes the type of some tokens based on their context.
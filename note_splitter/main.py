@@ -6,6 +6,7 @@ import webbrowser
 from tkinter import filedialog
 from typing import Callable
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Union
 
@@ -49,7 +50,9 @@ def run_main_menu() -> None:
         )
 
 
-def split_files(window: sg.Window, notes: List[note.Note] = None) -> List[note.Note]:
+def split_files(
+    window: sg.Window, notes: Optional[List[note.Note]] = None
+) -> List[note.Note]:
     """Splits files into multiple smaller files.
 
     If no notes are provided, they will be found using the split keyword
@@ -59,7 +62,7 @@ def split_files(window: sg.Window, notes: List[note.Note] = None) -> List[note.N
     ----------
     window : sg.Window
         The main menu window.
-    notes : List[note.Note]
+    notes : List[note.Note], optional
         The notes to be split.
 
     Returns
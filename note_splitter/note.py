@@ -5,9 +5,11 @@ import re
 import subprocess
 import uuid
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from datetime import datetime
 from datetime import timedelta
+from functools import partial
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -38,7 +40,11 @@ class Note:
         The absolute path to the folder that the file is in.
     """
 
-    def __init__(self, path: str, folder_path: str = None, name: str = None):
+    __slots__ = ("title", "name", "ext", "path", "folder_path")
+
+    def __init__(
+        self, path: str, folder_path: Optional[str] = None, name: Optional[str] = None
+    ):
         """Creates a new Note object.
 
         Assumes that the file already exists and has its content.
@@ -153,7 +159,9 @@ class Note:
         return True
 
 
-def get_chosen_notes(window: sg.Window, all_notes: List[Note] = None) -> List[Note]:
+def get_chosen_notes(
+    window: sg.Window, all_notes: Optional[List[Note]] = None
+) -> List[Note]:
     """Gets the notes that the user chose to split.
 
     Parameters
@@ -170,14 +178,42 @@ def get_chosen_notes(window: sg.Window, all_notes: List[Note] = None) -> List[No
     if not all_notes:
         return []
 
-    chosen_notes: List[Note] = []
-    for note in all_notes:
-        with open(note.path, "r", encoding="utf8") as file:
-            contents = file.read()
-        if settings["split_keyword"] in contents:
-            chosen_notes.append(note)
+    # The files are searched without being decoded. Reading files
+    # releases the GIL, so they are searched in multiple threads.
+    split_keyword: bytes = settings["split_keyword"].encode("utf8")
+    with ThreadPoolExecutor() as executor:
+        keyword_results = executor.map(
+            lambda note: __file_contains(note.path, split_keyword), all_notes
+        )
+        return [note for note, found in zip(all_notes, keyword_results) if found]
 
-    return chosen_notes
+
+def __file_contains(file_path: str, search_bytes: bytes) -> bool:
+    """Determines whether a file contains certain bytes.
+
+    Parameters
+    ----------
+    file_path : str
+        The absolute path to the file.
+    search_bytes : bytes
+        The bytes to search for.
+    """
+    if not search_bytes:
+        return True
+    # The file is read in chunks so that the search can stop as soon as
+    # the bytes are found. The end of each chunk is kept to find bytes
+    # that are split between two chunks.
+    tail_size = len(search_bytes) - 1
+    tail = b""
+    with open(file_path, "rb", buffering=0) as file:
+        for chunk in iter(partial(file.read, 65536), b""):
+            if search_bytes in chunk:
+                return True
+            if tail_size:
+                if search_bytes in tail + chunk[:tail_size]:
+                    return True
+                tail = (tail + chunk[-tail_size:])[-tail_size:]
+    return False
 
 
 def require_folder_path(folder_description: str) -> str:
@@ -230,7 +266,7 @@ def get_all_notes(window: sg.Window) -> List[Note]:
     """
     notes: List[Note] = []
     try:
-        folder_list = os.listdir(settings["source_folder_path"])
+        folder_entries = list(os.scandir(settings["source_folder_path"]))
     except FileNotFoundError:
         source_folder_path = request_folder_path("source")
         if not source_folder_path:
@@ -238,14 +274,18 @@ def get_all_notes(window: sg.Window) -> List[Note]:
         else:
             settings["source_folder_path"] = source_folder_path
             window["-SOURCE FOLDER-"].update(settings["source_folder_path"])
-            folder_list = os.listdir(source_folder_path)
-
-    for file_name in folder_list:
-        file_path = os.path.join(settings["source_folder_path"], file_name)
-        if os.path.isfile(file_path):
-            _, file_ext = os.path.splitext(file_name)
-            if file_ext in settings["note_types"]:
-                notes.append(Note(file_path, settings["source_folder_path"], file_name))
+            folder_entries = list(os.scandir(source_folder_path))
+
+    note_types = frozenset(t.lower() for t in settings["note_types"])
+    for entry in folder_entries:
+        # The directory entry usually already knows its file type, so
+        # this rarely needs a separate stat call.
+        if entry.is_file():
+            _, file_ext = os.path.splitext(entry.name)
+            if file_ext.lower() in note_types:
+                notes.append(
+                    Note(entry.path, settings["source_folder_path"], entry.name)
+                )
 
     return notes
 
@@ -315,7 +355,7 @@ def __create_file_name(
     return f"{file_name_format}{file_ext}"
 
 
-def create_file_id(file_contents: str, dt: datetime = None) -> str:
+def create_file_id(file_contents: str, dt: Optional[datetime] = None) -> str:
     """Creates an ID for a file.
 
     This function depends on the file_id_format setting.
@@ -445,7 +485,7 @@ def move_files(
     paths_of_files_to_move: List[str],
     destination_path: str,
     window: sg.Window,
-    all_notes: List[Note] = None,
+    all_notes: Optional[List[Note]] = None,
 ) -> None:
     """Moves files and updates all relevant references everywhere.
 
@@ -52,10 +52,7 @@ class AST:
 
     def __str__(self) -> str:
         """Returns the original content of the AST's raw text."""
-        raw_content = []
-        for token in self.content:
-            raw_content.append(str(token))
-        return "".join(raw_content)
+        return "".join(map(str, self.content))
 
     def __get_frontmatter(self) -> Optional[object]:
         """Gets frontmatter from the tokens list, if it has frontmatter.
@@ -70,7 +70,7 @@ header = re.compile(r"^#+ .+")
 horizontal_rule = re.compile(r"^\s*(?:(?:-\s*){3,}|(?:\*\s*){3,}|(?:_\s*){3,})$")
 math_fence = re.compile(r"^\s*\$\$\s*$")
 ordered_list_item = re.compile(r"^\s*\d+[.)]\s.*")
-table_divider = re.compile(r"^\|?(?: *[-:]{3,} *\|?)+$")
+table_divider = re.compile(r"^\|? *[-:]{3,}(?:(?: +(?:\| *)?|\| *)[-:]{3,})* *\|?$")
 table_row = re.compile(r"^\|.+\|$")
 task = re.compile(r"^\s*[*+-] \[[x\s]\] .+")
 unordered_list_item = re.compile(r"^\s*[*+-]\s.*")
@@ -105,11 +105,15 @@ format setting.
 
 Every time file_id_format is changed, file_id_regex must be updated.
 """
+import copy
 import json
+import os
+import re
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Type
 
 from note_splitter import patterns
@@ -155,15 +159,23 @@ __DEFAULT_SETTINGS = {
 
 
 settings: Dict[str, Any] = {}
+__token_types_by_name: Optional[Dict[str, Type]] = None
+__CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
 
 
 def save_settings() -> None:
     """Save the settings to a JSON file."""
     split_type: Type = settings["split_type"]
     settings["split_type"] = get_token_type_name(split_type)
-    with open("settings.json", "w") as file:
-        json.dump(settings, file, indent=4)
-    settings["split_type"] = split_type
+    try:
+        settings_json = json.dumps(settings, indent=4)
+    finally:
+        settings["split_type"] = split_type
+    # The settings are written to a temporary file first so that a crash
+    # while saving cannot leave a partly written settings file.
+    with open("settings.json.tmp", "w", encoding="utf8") as file:
+        file.write(settings_json)
+    os.replace("settings.json.tmp", "settings.json")
 
 
 def load_settings() -> None:
@@ -173,10 +185,10 @@ def load_settings() -> None:
     settings are used.
     """
     try:
-        with open("settings.json", "r") as file:
-            settings.update(json.load(file))
+        with open("settings.json", "r", encoding="utf8") as file:
+            settings.update(json.loads(file.read()))
     except (FileNotFoundError, json.JSONDecodeError):
-        settings.update(__DEFAULT_SETTINGS)
+        settings.update(copy.deepcopy(__DEFAULT_SETTINGS))
     else:
         if "null" in settings["split_attrs"]:
             settings["split_attrs"] = {None: ""}
@@ -188,17 +200,18 @@ def add_new_settings() -> None:
     """Add any new settings to the settings file."""
     for key, value in __DEFAULT_SETTINGS.items():
         if key not in settings:
-            settings[key] = value
+            settings[key] = copy.deepcopy(value)
 
 
 def reset_settings() -> None:
     """Reset the settings to their defaults."""
     settings.clear()
-    settings.update(__DEFAULT_SETTINGS)
+    settings.update(copy.deepcopy(__DEFAULT_SETTINGS))
 
 
 def get_token_type_names(
-    filter_predicate: Callable[[Type], bool] = None, all_token_types: List[Type] = None
+    filter_predicate: Optional[Callable[[Type], bool]] = None,
+    all_token_types: Optional[List[Type]] = None,
 ) -> List[str]:
     """Get all token types' output-formatted names.
 
@@ -210,10 +223,9 @@ def get_token_type_names(
         A list of all token types. If not provided, the list of all
         token types will be fetched.
     """
-    if not all_token_types:
-        all_token_types = tokens.get_all_token_types(tokens)
+    if all_token_types is None:
+        all_token_types = tokens.get_all_token_types()
     token_names = []
-    assert all_token_types is not None
     for token_type in all_token_types:
         if not filter_predicate or filter_predicate(token_type):
             token_names.append(get_token_type_name(token_type))
@@ -228,15 +240,11 @@ def get_token_type_name(token_type: Type) -> str:
     token_type : Type
         The token type to get the name of.
     """
-    token_name = []
     try:
-        for i, letter in enumerate(token_type.__name__):
-            if i and letter.isupper():
-                token_name.append(" ")
-            token_name.append(letter)
+        type_name = token_type.__name__
     except AttributeError:
         raise TypeError(f"{token_type} is not a Type.")
-    return "".join(token_name).lower()
+    return __CAMEL_CASE_BOUNDARY.sub(" ", type_name).lower()
 
 
 def get_token_type(chosen_name: str) -> Type:
@@ -247,9 +255,12 @@ def get_token_type(chosen_name: str) -> Type:
     chosen_name : str
         The output-formatted name of the token type to get.
     """
-    all_token_types: List[Type] = tokens.get_all_token_types(tokens)
-    token_type_names = get_token_type_names(None, all_token_types)
-    for name, type_ in zip(token_type_names, all_token_types):
-        if name == chosen_name:
-            return type_
-    raise ValueError(f'Token type "{chosen_name}" not found.')
+    global __token_types_by_name
+    if __token_types_by_name is None:
+        all_token_types: List[Type] = tokens.get_all_token_types()
+        token_type_names = get_token_type_names(None, all_token_types)
+        __token_types_by_name = dict(zip(token_type_names, all_token_types))
+    try:
+        return __token_types_by_name[chosen_name]
+    except KeyError:
+        raise ValueError(f'Token type "{chosen_name}" not found.')
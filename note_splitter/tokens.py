@@ -10,13 +10,10 @@ subtokens. Each token class also has a boolean class variable (not an instance
 variable) named ``HAS_PATTERN``. If ``HAS_PATTERN`` is True, the class has a
 corresponding regular expression in patterns.py.
 """
-import inspect
-from abc import ABC
 from abc import abstractmethod
-from functools import lru_cache
-from types import ModuleType
 from typing import Any
 from typing import List
+from typing import Optional
 from typing import Type
 
 from note_splitter import patterns
@@ -28,17 +25,57 @@ def _get_indentation_level(line: str) -> int:
     If there are tabs instead, each tab is counted as 4 spaces. This
     function assumes tabs and spaces are not mixed.
     """
-    level = len(line) - len(line.lstrip(" "))
-    if not level:
+    first_char = line[:1]
+    if first_char == " ":
+        return len(line) - len(line.lstrip(" "))
+    if first_char == "\t":
         tab_count = len(line) - len(line.lstrip("\t"))
-        level = tab_count * 4
-    return level
+        return tab_count * 4
+    return 0
 
 
-class Token(ABC):
+def _set_abstract_methods(cls: type) -> None:
+    """Sets a class' ``__abstractmethods__`` to its still-abstract methods.
+
+    This prevents the class from being instantiated if any of its
+    methods are still abstract and makes ``inspect.isabstract`` work for
+    it, just like ``abc.ABCMeta`` does, but without ABCMeta's slower
+    ``isinstance`` checks.
+    """
+    names = set()
+    for name in dir(cls):
+        if getattr(getattr(cls, name, None), "__isabstractmethod__", False):
+            names.add(name)
+    setattr(cls, "__abstractmethods__", frozenset(names))
+
+
+_all_token_types: List[type] = []
+
+
+def _register_token_type(token_type: type) -> None:
+    """Adds a token type to the list of all token types.
+
+    Only token types defined in this module are added; subclasses
+    defined elsewhere have no pattern in patterns.py and are not split
+    types. The list is kept sorted by name because the lexer tries the
+    token types' patterns in this order.
+    """
+    if token_type.__module__ != __name__:
+        return
+    _all_token_types.append(token_type)
+    _all_token_types.sort(key=lambda type_: type_.__name__)
+
+
+class Token:
     """The abstract base class (ABC) for all tokens."""
 
     HAS_PATTERN = False
+    __slots__ = ("_content",)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _set_abstract_methods(cls)
+        _register_token_type(cls)
 
     @abstractmethod
     def __init__(self):
@@ -57,9 +94,15 @@ class Token(ABC):
         pass
 
 
+_set_abstract_methods(Token)
+_register_token_type(Token)
+
+
 class Line(Token):
     """The ABC for tokens that take up one line of a file."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, line: str = ""):
         self._content = line
@@ -76,6 +119,8 @@ class Line(Token):
 class Block(Token):
     """The ABC for tokens that are each a combination of tokens."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self):
         pass
@@ -90,7 +135,32 @@ class Block(Token):
 
     def __str__(self):
         """Returns the original content of the token's raw text."""
-        return "".join([str(token) for token in self._content])
+        raw_content: List[str] = []
+        self.__append_raw_content(raw_content)
+        return "".join(raw_content)
+
+    def __append_raw_content(self, raw_content: List[str]) -> None:
+        """Appends the raw text of the token's subtokens to a list.
+
+        Nested blocks append to the same list, so the text of the whole
+        block is only joined once. Single-line tokens' content and
+        newlines are appended separately instead of first being
+        concatenated for each token.
+
+        Parameters
+        ----------
+        raw_content : List[str]
+            The list to append the pieces of raw text to.
+        """
+        for token in self._content:
+            content = token._content
+            if isinstance(content, str):
+                raw_content.append(content)
+                raw_content.append("\n")
+            elif isinstance(token, Block):
+                token.__append_raw_content(raw_content)
+            else:
+                raw_content.append(str(token))
 
     def __len__(self):
         """Returns the length of the token's content."""
@@ -136,6 +206,8 @@ class Block(Token):
 class CanHaveInlineElements(Line):
     """The ABC for single-line tokens that can have inline elements."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, line: str = ""):
         self._content = line
@@ -144,6 +216,8 @@ class CanHaveInlineElements(Line):
 class TextListItem(Line):
     """The ABC for text list item tokens."""
 
+    __slots__ = ("level",)
+
     @abstractmethod
     def __init__(self):
         self.level: int
@@ -152,6 +226,8 @@ class TextListItem(Line):
 class TablePart(Line):
     """The ABC for tokens that tables are made out of."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self):
         pass
@@ -160,6 +236,8 @@ class TablePart(Line):
 class Fence(Line):
     """The ABC for tokens that block fences are made out of."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self):
         pass
@@ -168,6 +246,8 @@ class Fence(Line):
 class Fenced(Line):
     """The ABC for tokens that are between Fence tokens."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self):
         pass
@@ -187,6 +267,8 @@ class Text(CanHaveInlineElements):
         The number of spaces of indentation.
     """
 
+    __slots__ = ("level",)
+
     def __init__(self, line: str = ""):
         self._content: str = line
         self.level: int = _get_indentation_level(line)
@@ -202,6 +284,7 @@ class EmptyLine(Line):
     """
 
     HAS_PATTERN = True
+    __slots__ = ()
 
     def __init__(self, line: str = ""):
         self._content: str = line
@@ -216,19 +299,26 @@ class Header(CanHaveInlineElements):
         The content of the line of text.
     body : str
         The content of the line of text not including the header
-        symbol(s) and their following whitespace character(s).
+        symbol(s) and surrounding whitespace characters. This is
+        derived from the current content, so it reflects changes such
+        as removing the split keyword.
     level : int
         The header level. A header level of 1 is the largest possible
         header.
     """
 
     HAS_PATTERN = True
+    __slots__ = ("level",)
 
     def __init__(self, line: str = ""):
         self._content: str = line
-        self.body: str = line.lstrip("#")
-        self.level: int = len(line) - len(self.body)
-        self.body = self.body.lstrip()
+        self.level: int = len(line) - len(line.lstrip("#"))
+
+    @property
+    def body(self) -> str:
+        # Most headers' bodies are never read, so each is only found on
+        # request.
+        return self._content.lstrip("#").strip()
 
 
 class HorizontalRule(Line):
@@ -241,6 +331,7 @@ class HorizontalRule(Line):
     """
 
     HAS_PATTERN = True
+    __slots__ = ()
 
     def __init__(self, line: str = ""):
         self._content: str = line
@@ -258,6 +349,7 @@ class Blockquote(CanHaveInlineElements):
     """
 
     HAS_PATTERN = True
+    __slots__ = ("level",)
 
     def __init__(self, line: str = ""):
         self._content: str = line
@@ -273,8 +365,10 @@ class BlockquoteBlock(Block):
         The consecutive blockquote tokens.
     """
 
-    def __init__(self, tokens_: List[Any] = None):
-        self._content: List[Any] = tokens_ or []
+    __slots__ = ()
+
+    def __init__(self, tokens_: Optional[List[Any]] = None):
+        self._content: List[Any] = [] if tokens_ is None else tokens_
 
 
 class Footnote(CanHaveInlineElements):
@@ -290,6 +384,7 @@ class Footnote(CanHaveInlineElements):
     """
 
     HAS_PATTERN = True
+    __slots__ = ("reference",)
 
     def __init__(self, line: str = ""):
         self._content: str = line
@@ -313,6 +408,7 @@ class Task(TextListItem, CanHaveInlineElements):
     """
 
     HAS_PATTERN = True
+    __slots__ = ("is_done",)
 
     def __init__(self, line: str = ""):
         self._content: str = line
@@ -335,6 +431,7 @@ class UnorderedListItem(TextListItem, CanHaveInlineElements):
     """
 
     HAS_PATTERN = True
+    __slots__ = ()
 
     def __init__(self, line: str = ""):
         self._content: str = line
@@ -353,6 +450,7 @@ class OrderedListItem(TextListItem, CanHaveInlineElements):
     """
 
     HAS_PATTERN = True
+    __slots__ = ()
 
     def __init__(self, line: str = ""):
         self._content: str = line
@@ -374,8 +472,10 @@ class TextList(Block):
         list.
     """
 
-    def __init__(self, tokens_: List[Any] = None):
-        self._content: List[Any] = tokens_ or []
+    __slots__ = ("level",)
+
+    def __init__(self, tokens_: Optional[List[Any]] = None):
+        self._content: List[Any] = [] if tokens_ is None else tokens_
         if tokens_:
             self.level: int = tokens_[0].level
         else:
@@ -392,6 +492,7 @@ class TableRow(TablePart):
     """
 
     HAS_PATTERN = True
+    __slots__ = ()
 
     def __init__(self, line: str = ""):
         self._content: str = line
@@ -408,6 +509,7 @@ class TableDivider(TablePart):
     """
 
     HAS_PATTERN = True
+    __slots__ = ()
 
     def __init__(self, line: str = ""):
         self._content: str = line
@@ -422,8 +524,10 @@ class Table(Block):
         The table's row token(s) and possibly divider token(s).
     """
 
-    def __init__(self, tokens_: List[Any] = None):
-        self._content: List[Any] = tokens_ or []
+    __slots__ = ()
+
+    def __init__(self, tokens_: Optional[List[Any]] = None):
+        self._content: List[Any] = [] if tokens_ is None else tokens_
 
 
 class CodeFence(Fence):
@@ -441,10 +545,15 @@ class CodeFence(Fence):
     """
 
     HAS_PATTERN = True
+    __slots__ = ()
 
     def __init__(self, line: str = ""):
         self._content: str = line
-        self.language: str = line.lstrip("~").lstrip("`").strip()
+
+    @property
+    def language(self) -> str:
+        # The language is rarely needed, so it is only found on request.
+        return self._content.lstrip(" \t~`").rstrip()
 
 
 class Code(Fenced):
@@ -456,6 +565,8 @@ class Code(Fenced):
         The content of the line of text.
     """
 
+    __slots__ = ()
+
     def __init__(self, line: str = ""):
         self._content: str = line
 
@@ -473,8 +584,10 @@ class CodeBlock(Block):
         characters are removed.
     """
 
-    def __init__(self, tokens_: List[Any] = None):
-        self._content: List[Any] = tokens_ or []
+    __slots__ = ("language",)
+
+    def __init__(self, tokens_: Optional[List[Any]] = None):
+        self._content: List[Any] = [] if tokens_ is None else tokens_
         if tokens_:
             self.language: str = tokens_[0].language
         else:
@@ -491,6 +604,7 @@ class MathFence(Fence):
     """
 
     HAS_PATTERN = True
+    __slots__ = ()
 
     def __init__(self, line: str = ""):
         self._content: str = line
@@ -505,6 +619,8 @@ class Math(Fenced):
         The content of the line of text.
     """
 
+    __slots__ = ()
+
     def __init__(self, line: str = ""):
         self._content: str = line
 
@@ -521,8 +637,10 @@ class MathBlock(Block):
         The mathblock's math fence tokens surrounding math token(s).
     """
 
-    def __init__(self, tokens_: List[Any] = None):
-        self._content: List[Any] = tokens_ or []
+    __slots__ = ()
+
+    def __init__(self, tokens_: Optional[List[Any]] = None):
+        self._content: List[Any] = [] if tokens_ is None else tokens_
 
 
 class Section(Block):
@@ -539,33 +657,38 @@ class Section(Block):
         split type.
     """
 
-    def __init__(self, tokens_: List[Any] = None):
-        self._content: List[Any] = tokens_ or []
+    __slots__ = ()
 
+    def __init__(self, tokens_: Optional[List[Any]] = None):
+        self._content: List[Any] = [] if tokens_ is None else tokens_
 
-def __is_token_type(obj: Any) -> bool:
-    """Returns True if obj is a Token type.
-
-    Parameters
-    ----------
-    obj : Any
-        The object to test.
-    """
-    return inspect.isclass(obj) and obj.__name__ not in ("ABC", "module")
 
+def get_attr_names(token_type: Type[Token]) -> List[str]:
+    """Gets the sorted names of a token type's public instance attributes.
 
-@lru_cache(maxsize=1)
-def get_all_token_types(tokens_module: ModuleType) -> List[Type[Token]]:
-    """Gets the list of all token types.
-
-    Call the function like this: ``tokens.get_all_token_types(tokens)``.
+    Properties are included, except for ``content``.
 
     Parameters
     ----------
-    tokens_module : ModuleType
-        The module containing the token types. There is only one correct
-        argument. The only reason why the argument is required is
-        because there doesn't seem to be any other way to automatically
-        get the list of token types from within the file they are in.
+    token_type : Type[Token]
+        The token type to get the attribute names of. It must not be
+        abstract.
+    """
+    token = token_type()
+    attr_names = set()
+    for class_ in token_type.__mro__:
+        names = list(getattr(class_, "__slots__", ()))
+        names += [k for k, v in vars(class_).items() if isinstance(v, property)]
+        for name in names:
+            if not name.startswith("_") and hasattr(token, name):
+                attr_names.add(name)
+    attr_names.discard("content")
+    return sorted(attr_names)
+
+
+def get_all_token_types() -> List[Type[Token]]:
+    """Gets the list of all token types, sorted by name.
+
+    Each token type is added to the list when its class is created.
     """
-    return [c[1] for c in inspect.getmembers(tokens_module, __is_token_type)]
+    return _all_token_types
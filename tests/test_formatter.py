@@ -225,6 +225,13 @@ def test_get_section_title_with_header():
     assert "This is a title" == formatter_.Formatter().get_section_title(section)
 
 
+def test_get_section_title_with_split_keyword_removed():
+    header = tokens.Header("## First #split")
+    header.content = header.content.replace("#split", "")
+    section = tokens.Section([header, tokens.Text("text")])
+    assert "First" == formatter_.Formatter().get_section_title(section)
+
+
 def test_get_section_title_with_header_after_text():
     section = tokens.Section(
         [
@@ -1,4 +1,7 @@
+import re
+
 from note_splitter import lexer
+from note_splitter import patterns
 from note_splitter import tokens
 
 
@@ -40,3 +43,44 @@ def test_tokenize_with_code_block():
     assert isinstance(tokens_[0], tokens.CodeFence)
     assert isinstance(tokens_[1], tokens.Code)
     assert isinstance(tokens_[2], tokens.CodeFence)
+
+
+def test_tokenize_with_custom_pattern():
+    default_pattern = patterns.header
+    patterns.__dict__["header"] = re.compile(r"^#+.+")
+    try:
+        tokenize = lexer.Lexer()
+        tokens_ = tokenize("#not a tag")
+    finally:
+        patterns.__dict__["header"] = default_pattern
+    assert isinstance(tokens_[0], tokens.Header)
+
+
+def test_tokenize_with_table():
+    tokenize = lexer.Lexer()
+    tokens_ = tokenize("| a | b |\n| --- | :-: |\n| c | d |")
+    assert isinstance(tokens_[1], tokens.TableDivider)
+
+
+def test_tokenize_with_long_line_of_dashes():
+    # This would take far too long if the table divider pattern
+    # backtracked exponentially.
+    tokenize = lexer.Lexer()
+    tokens_ = tokenize("-" * 100 + "x")
+    assert isinstance(tokens_[0], tokens.Text)
+
+
+def test_tokenize_with_repeated_lines():
+    tokenize = lexer.Lexer()
+    tokens_ = tokenize("same line\nother line\nsame line")
+    assert tokens_[0].content is tokens_[2].content
+    assert tokens_[0] is not tokens_[2]
+
+
+def test_tokenize_with_outside_token_subclass():
+    class OutsideHeader(tokens.Header):
+        __slots__ = ()
+
+    tokenize = lexer.Lexer()
+    tokens_ = tokenize("# hi")
+    assert type(tokens_[0]) is tokens.Header
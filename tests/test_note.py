@@ -1,7 +1,9 @@
 import os
+import re
 from datetime import datetime
 
 from note_splitter import note
+from note_splitter import patterns
 from note_splitter.settings import load_settings
 from note_splitter.settings import settings
 
@@ -365,5 +367,90 @@ def test_make_file_paths_absolute_with_two_paths():
 ################################
 
 
-def test___change_all_links_to_file():
-    pass
+def test___change_all_links_to_file(tmp_path):
+    linked_path = tmp_path / "linked.md"
+    linked_path.write_text("# linked", encoding="utf8")
+    linking_path = tmp_path / "linking.md"
+    linking_path.write_text("# linking\n\n[link](linked.md)", encoding="utf8")
+    unlinked_path = tmp_path / "unlinked.md"
+    unlinked_path.write_text("# unlinked", encoding="utf8")
+    all_notes = [note.Note(str(p)) for p in (linking_path, unlinked_path)]
+    new_path = os.path.join(str(tmp_path), "folder", "linked.md")
+    note.__change_all_links_to_file(str(linked_path), new_path, all_notes)
+    expected_content = f"# linking\n\n[link]({new_path})"
+    assert expected_content == linking_path.read_text(encoding="utf8")
+    assert "# unlinked" == unlinked_path.read_text(encoding="utf8")
+
+
+def test___change_all_links_to_file_with_custom_link_pattern(tmp_path):
+    linked_path = tmp_path / "linked.md"
+    linked_path.write_text("# linked", encoding="utf8")
+    linking_path = tmp_path / "linking.md"
+    linking_path.write_text("# linking\n\n[[linked.md]]", encoding="utf8")
+    all_notes = [note.Note(str(linking_path))]
+    new_path = os.path.join(str(tmp_path), "folder", "linked.md")
+    default_pattern = patterns.file_path_in_link
+    patterns.__dict__["file_path_in_link"] = re.compile(
+        r"(?<=\[\[)(?P<path>[^\]]+?(?P<basename>[^/\\\]]*?)(?P<ext>\.md))(?=\]\])"
+    )
+    try:
+        note.__change_all_links_to_file(str(linked_path), new_path, all_notes)
+    finally:
+        patterns.__dict__["file_path_in_link"] = default_pattern
+    expected_content = f"# linking\n\n[[{new_path}]]"
+    assert expected_content == linking_path.read_text(encoding="utf8")
+
+
+###################
+#  get_all_notes  #
+###################
+
+
+def test_get_all_notes():
+    source_folder_path = settings["source_folder_path"]
+    settings["source_folder_path"] = os.path.join(os.getcwd(), "tests/assets")
+    try:
+        notes = note.get_all_notes(None)
+    finally:
+        settings["source_folder_path"] = source_folder_path
+    names = sorted(n.name for n in notes)
+    assert names == ["empty-file.md", "sample_markdown.md", "small-file.md"]
+
+
+######################
+#  get_chosen_notes  #
+######################
+
+
+def test_get_chosen_notes():
+    folder_path = os.path.join(os.getcwd(), "tests/assets")
+    all_notes = [
+        note.Note(os.path.join(folder_path, name))
+        for name in ("empty-file.md", "sample_markdown.md", "small-file.md")
+    ]
+    split_keyword = settings["split_keyword"]
+    settings["split_keyword"] = "#tag"
+    try:
+        chosen_notes = note.get_chosen_notes(None, all_notes)
+    finally:
+        settings["split_keyword"] = split_keyword
+    assert [n.name for n in chosen_notes] == ["sample_markdown.md", "small-file.md"]
+
+
+#####################
+#  __file_contains  #
+#####################
+
+
+def test___file_contains(tmp_path):
+    file_path = tmp_path / "file.md"
+    file_path.write_bytes(b"abc #split def")
+    assert note.__file_contains(str(file_path), b"#split")
+    assert not note.__file_contains(str(file_path), b"#splat")
+
+
+def test___file_contains_across_chunks(tmp_path):
+    file_path = tmp_path / "file.md"
+    file_path.write_bytes(b"a" * 65533 + b"#split" + b"a" * 100)
+    assert note.__file_contains(str(file_path), b"#split")
+    assert not note.__file_contains(str(file_path), b"#splat")
@@ -1,9 +1,66 @@
+import os
+
 import pytest
 
 from note_splitter import settings
 from note_splitter import tokens
 
 
+###################
+#  save_settings  #
+###################
+
+
+def test_save_settings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    original_settings = dict(settings.settings)
+    try:
+        settings.reset_settings()
+        settings.save_settings()
+        assert ["settings.json"] == os.listdir(tmp_path)
+        assert tokens.Header == settings.settings["split_type"]
+        settings.settings.clear()
+        settings.load_settings()
+        assert tokens.Header == settings.settings["split_type"]
+    finally:
+        settings.settings.clear()
+        settings.settings.update(original_settings)
+
+
+def test_save_settings_with_unserializable_setting(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    original_settings = dict(settings.settings)
+    try:
+        settings.reset_settings()
+        settings.settings["unserializable"] = object()
+        with pytest.raises(TypeError):
+            settings.save_settings()
+        assert [] == os.listdir(tmp_path)
+        assert tokens.Header == settings.settings["split_type"]
+    finally:
+        settings.settings.clear()
+        settings.settings.update(original_settings)
+
+
+####################
+#  reset_settings  #
+####################
+
+
+def test_reset_settings_does_not_share_defaults():
+    original_settings = dict(settings.settings)
+    try:
+        settings.reset_settings()
+        settings.settings["note_types"].append(".org")
+        settings.settings["split_attrs"]["level"] = 3
+        settings.reset_settings()
+        assert ".org" not in settings.settings["note_types"]
+        assert {"level": 2} == settings.settings["split_attrs"]
+    finally:
+        settings.settings.clear()
+        settings.settings.update(original_settings)
+
+
 ##########################
 #  get_token_type_names  #
 ##########################
@@ -20,6 +77,10 @@ def test_get_token_type_names_with_invalid_token_type_name():
         settings.get_token_type_name("This function doesn't take strings.")
 
 
+def test_get_token_type_names_with_empty_list():
+    assert [] == settings.get_token_type_names(None, [])
+
+
 def test_get_token_type_with_blockquote():
     assert tokens.Blockquote not in settings.get_token_type_names(
         lambda token_type: not issubclass(token_type, tokens.Blockquote)
@@ -1,4 +1,6 @@
-from abc import ABC
+import inspect
+
+import pytest
 
 from note_splitter import tokens
 
@@ -15,21 +17,141 @@ def test__get_indentation_level():
     assert 16 == tokens._get_indentation_level("                ")
 
 
-#####################
-#  __is_token_type  #
-#####################
+def test__get_indentation_level_with_tabs():
+    assert 4 == tokens._get_indentation_level("\t- item")
+    assert 8 == tokens._get_indentation_level("\t\t- item")
+
+
+def test__get_indentation_level_without_indentation():
+    assert 0 == tokens._get_indentation_level("- item")
+    assert 0 == tokens._get_indentation_level("")
+
+
+###########
+#  Block  #
+###########
+
+
+def test_block_str_with_nested_blocks():
+    section = tokens.Section(
+        [
+            tokens.Header("# title"),
+            tokens.TextList(
+                [
+                    tokens.UnorderedListItem("- item"),
+                    tokens.TextList([tokens.UnorderedListItem("    - subitem")]),
+                ]
+            ),
+            tokens.Text("text"),
+        ]
+    )
+    assert "# title\n- item\n    - subitem\ntext\n" == str(section)
+
+
+############
+#  Header  #
+############
+
+
+def test_header():
+    header = tokens.Header("### A title")
+    assert 3 == header.level
+    assert "A title" == header.body
+
+
+def test_header_body_with_trailing_whitespace():
+    assert "A title" == tokens.Header("## A title  ").body
+
+
+def test_header_body_after_content_change():
+    header = tokens.Header("### A title")
+    header.content = "# Another title"
+    assert "Another title" == header.body
+
+
+###############
+#  CodeFence  #
+###############
+
+
+def test_code_fence_language():
+    assert "python" == tokens.CodeFence("```python").language
+    assert "py" == tokens.CodeFence("~~~ py ").language
+    assert "" == tokens.CodeFence("```").language
+
+
+def test_code_fence_language_with_indentation():
+    assert "js" == tokens.CodeFence("   ```js").language
+
+
+def test_code_fence_language_after_content_change():
+    code_fence = tokens.CodeFence("```python")
+    code_fence.content = "```js"
+    assert "js" == code_fence.language
 
 
-def test___is_token_type():
-    assert tokens.__is_token_type(tokens.Blockquote)
+##########################
+#  abstract token types  #
+##########################
 
 
-def test___is_token_type_with_string():
-    assert not tokens.__is_token_type("this isn't even a type")
+def test_abstract_token_types_are_abstract():
+    assert inspect.isabstract(tokens.Token)
+    assert inspect.isabstract(tokens.Line)
+    assert inspect.isabstract(tokens.TextListItem)
+    assert not inspect.isabstract(tokens.Header)
+    assert not inspect.isabstract(tokens.Section)
 
 
-def test___is_token_type_with_type_that_is_not_a_token_type():
-    assert not tokens.__is_token_type(ABC)
+def test_subclass_that_overrides_every_abstract_method_is_not_abstract():
+    class NewLine(tokens.Line):
+        __slots__ = ()
+
+        def __init__(self, line: str = ""):
+            self._content = line
+
+    assert not inspect.isabstract(NewLine)
+    assert "text" == NewLine("text").content
+
+
+def test_subclass_that_overrides_no_abstract_method_is_abstract():
+    class NewLine(tokens.Line):
+        __slots__ = ()
+
+    assert inspect.isabstract(NewLine)
+    with pytest.raises(TypeError):
+        NewLine("text")
+
+
+def test_abstract_token_types_cannot_be_instantiated():
+    with pytest.raises(TypeError):
+        tokens.Line("text")
+    with pytest.raises(TypeError):
+        tokens.Block()
+
+
+####################
+#  get_attr_names  #
+####################
+
+
+def test_get_attr_names():
+    assert ["body", "level"] == tokens.get_attr_names(tokens.Header)
+    assert ["is_done", "level"] == tokens.get_attr_names(tokens.Task)
+
+
+def test_get_attr_names_with_property():
+    assert ["language"] == tokens.get_attr_names(tokens.CodeFence)
+
+
+def test_get_attr_names_with_block():
+    assert ["level"] == tokens.get_attr_names(tokens.TextList)
+    assert [] == tokens.get_attr_names(tokens.Section)
+
+
+def test_tokens_have_no_instance_dict():
+    assert not hasattr(tokens.Text("text"), "__dict__")
+    assert not hasattr(tokens.Section(), "__dict__")
 
 
 #########################
@@ -38,6 +160,20 @@ def test___is_token_type_with_type_that_is_not_a_token_type():
 
 
 def test_get_all_token_types():
-    all_token_types = tokens.get_all_token_types(tokens)
+    all_token_types = tokens.get_all_token_types()
     assert len(all_token_types) >= 28
     assert tokens.Blockquote in all_token_types
+
+
+def test_get_all_token_types_is_sorted_by_name():
+    all_token_types = tokens.get_all_token_types()
+    assert tokens.Token in all_token_types
+    names = [type_.__name__ for type_ in all_token_types]
+    assert sorted(names) == names
+
+
+def test_get_all_token_types_without_outside_subclasses():
+    class OutsideHeader(tokens.Header):
+        __slots__ = ()
+
+    assert OutsideHeader not in tokens.get_all_token_types()